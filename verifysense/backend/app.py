@@ -1,6 +1,6 @@
 import os
 import uuid
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from flask import Flask, request, jsonify
 from flask_cors import CORS
 from dotenv import load_dotenv
@@ -20,6 +20,9 @@ load_dotenv()
 app = Flask(__name__)
 CORS(app)
 
+# Upper bound on claims verified concurrently within a single request
+MAX_CLAIM_WORKERS = int(os.environ.get('MAX_CLAIM_WORKERS', 8))
+
 @app.route('/health', methods=['GET'])
 def health_check():
     return jsonify({'status': 'healthy', 'message': 'VerifySense API is running'})
@@ -29,7 +32,7 @@ def verify():
     data = request.json
     
     # Generate a unique request ID for tracking
-    request_id = data.get('request_id') or f"req_{int(datetime.now().timestamp())}"
+    request_id = data.get('request_id') or f"req_{uuid.uuid4().hex}"
     
     # Extract input type and content
     input_type = data.get('input_type', 'text')  # text, url, image
@@ -89,45 +92,13 @@ def verify():
             'request_id': request_id
         }), 400
     
-    # For each claim, check facts and gather evidence
-    results = []
-    for claim in claims:
-        app.logger.info(f"Processing claim: {claim[:50]}...")
-        
-        # Check against fact-checking services
-        fact_checks = check_facts(claim, request_id)
-        log_factcheck(request_id, claim, fact_checks)
-        
-        # Retrieve evidence from web search
-        evidence = get_evidence(claim)
-        
-        # Calculate credibility score
-        score = calculate_score(claim, fact_checks, evidence, request_id)
-        log_scoring(request_id, claim, score)
-        
-        # Generate explanation for verification process
-        explanation = generate_explanation(claim, fact_checks, evidence, score)
-        
-        # Check for features that are not fully implemented
-        unavailable_features = []
-        if fact_checks.get('google_fact_check') and any(check.get('implementation_status') == 'in-progress' for check in fact_checks.get('google_fact_check', [])):
-            unavailable_features.append('google_fact_check_api')
-        
-        if fact_checks.get('claim_buster') and fact_checks.get('claim_buster', {}).get('implementation_status') == 'in-progress':
-            unavailable_features.append('claimbuster_api')
-        
-        # Add feature status information for unavailable features
-        feature_notifications = {feature: feature_status[feature] for feature in unavailable_features if feature in feature_status}
-        
-        results.append({
-            'claim': claim,
-            'fact_checks': fact_checks,
-            'evidence': evidence,
-            'score': score,
-            'explanation': explanation,
-            'feature_notifications': feature_notifications,
-            'request_id': request_id
-        })
+    # Process all claims concurrently; each claim is dominated by network I/O
+    # and model inference, so threads overlap the waits
+    with ThreadPoolExecutor(max_workers=min(len(claims), MAX_CLAIM_WORKERS)) as executor:
+        results = list(executor.map(
+            lambda claim: process_claim(claim, request_id, feature_status),
+            claims
+        ))
     
     return jsonify({
         'status': 'success',
@@ -135,6 +106,56 @@ def verify():
         'request_id': request_id
     })
 
+def process_claim(claim, request_id, feature_status):
+    """
+    Run the verification pipeline for a single claim
+    
+    Args:
+        claim (str): The claim to verify
+        request_id (str): Unique identifier for the request for tracking
+        feature_status (dict): Availability status of optional features
+        
+    Returns:
+        dict: Verification result for the claim
+    """
+    app.logger.info(f"Processing claim: {claim[:50]}...")
+    
+    # Fact checking and evidence retrieval are independent, so run them in parallel
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        fact_checks_future = executor.submit(check_facts, claim, request_id)
+        evidence_future = executor.submit(get_evidence, claim)
+        fact_checks = fact_checks_future.result()
+        evidence = evidence_future.result()
+    log_factcheck(request_id, claim, fact_checks)
+    
+    # Calculate credibility score
+    score = calculate_score(claim, fact_checks, evidence, request_id)
+    log_scoring(request_id, claim, score)
+    
+    # Generate explanation for verification process
+    explanation = generate_explanation(claim, fact_checks, evidence, score)
+    
+    # Check for features that are not fully implemented
+    unavailable_features = []
+    if fact_checks.get('google_fact_check') and any(check.get('implementation_status') == 'in-progress' for check in fact_checks.get('google_fact_check', [])):
+        unavailable_features.append('google_fact_check_api')
+    
+    if fact_checks.get('claim_buster') and fact_checks.get('claim_buster', {}).get('implementation_status') == 'in-progress':
+        unavailable_features.append('claimbuster_api')
+    
+    # Add feature status information for unavailable features
+    feature_notifications = {feature: feature_status[feature] for feature in unavailable_features if feature in feature_status}
+    
+    return {
+        'claim': claim,
+        'fact_checks': fact_checks,
+        'evidence': evidence,
+        'score': score,
+        'explanation': explanation,
+        'feature_notifications': feature_notifications,
+        'request_id': request_id
+    }
+
 @app.route('/api/feedback', methods=['POST'])
 def submit_feedback():
     data = request.json
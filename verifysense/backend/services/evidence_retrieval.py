@@ -1,6 +1,8 @@
 import os
-import requests
+from functools import lru_cache
+from urllib.parse import urlsplit
 from dotenv import load_dotenv
+from utils.http_client import http_session
 
 # Load environment variables
 load_dotenv()
@@ -8,8 +10,8 @@ load_dotenv()
 # Google Custom Search API endpoint
 SEARCH_API_URL = "https://www.googleapis.com/customsearch/v1"
 
-# List of trusted news sources for better evidence quality
-TRUSTED_DOMAINS = [
+# Set of trusted news sources for better evidence quality
+TRUSTED_DOMAINS = {
     'reuters.com',
     'apnews.com',
     'bbc.com',
@@ -30,7 +32,7 @@ TRUSTED_DOMAINS = [
     'usatoday.com',
     'time.com',
     'theatlantic.com'
-]
+}
 
 def get_evidence(claim, max_results=5):
     """
@@ -61,7 +63,7 @@ def get_evidence(claim, max_results=5):
         }
         
         # Make the API request
-        response = requests.get(SEARCH_API_URL, params=params)
+        response = http_session.get(SEARCH_API_URL, params=params)
         
         # Check if the request was successful
         if response.status_code == 200:
@@ -95,6 +97,7 @@ def get_evidence(claim, max_results=5):
         print(f"Error retrieving evidence: {e}")
         return []
 
+@lru_cache(maxsize=8192)
 def extract_domain(url):
     """
     Extract domain name from a URL
@@ -106,13 +109,12 @@ def extract_domain(url):
         str: The extracted domain name
     """
     try:
-        # Remove protocol (http://, https://) and get the domain
-        domain = url.split('//')[1].split('/')[0]
-        
-        # Remove 'www.' if present
-        if domain.startswith('www.'):
-            domain = domain[4:]
-            
-        return domain
-    except:
-        return url
\ No newline at end of file
+        host = urlsplit(url).hostname
+    except ValueError:
+        host = None
+    
+    if not host:
+        return url
+    
+    # Remove 'www.' if present
+    return host.removeprefix('www.')
@@ -12,23 +12,15 @@ import os
 import logging
 import requests
 import json
-import hashlib
-from datetime import datetime
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from functools import lru_cache
+from cachetools import TTLCache
+from services.nlp_models import get_sentence_model, encode_texts
 
-# Setup logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# Initialize sentence transformer model for semantic similarity
-try:
-    model = SentenceTransformer('distilbert-base-nli-mean-tokens')
-    logger.info("NLP model loaded successfully for fact checking")
-except Exception as e:
-    logger.error(f"Error loading NLP model for fact checking: {str(e)}")
-    model = None
-
 # Trusted fact-checking sources
 FACT_CHECK_SOURCES = [
     "factcheck.org",
@@ -40,8 +32,24 @@ FACT_CHECK_SOURCES = [
     "fullfact.org"
 ]
 
-# Cache for fact checks to avoid repeated API calls
-fact_check_cache = {}
+# For demonstration, custom verification compares claims with pre-defined facts
+KNOWN_FACTS = [
+    "The Earth orbits around the Sun",
+    "Water boils at 100 degrees Celsius at sea level",
+    "The human body has 206 bones",
+    "Mount Everest is the tallest mountain on Earth",
+    "The Great Wall of China is visible from space"
+]
+
+@lru_cache(maxsize=1)
+def get_known_fact_embeddings():
+    """Encode KNOWN_FACTS on first use; they never change, so this happens once"""
+    return encode_texts(KNOWN_FACTS)
+
+# Cache for fact checks to avoid repeated API calls; bounded in size and
+# entries expire so stale verdicts are eventually refreshed
+fact_check_cache = TTLCache(maxsize=10_000, ttl=3600)
+fact_check_cache_lock = Lock()
 
 def check_facts(claim, request_id=None):
     """
@@ -56,15 +64,15 @@ def check_facts(claim, request_id=None):
     """
     # Generate request ID if not provided
     if not request_id:
-        request_id = hashlib.md5(f"{claim}_{datetime.now().isoformat()}".encode()).hexdigest()
+        request_id = uuid.uuid4().hex
     
     # Check cache first (only if not in development mode)
-    cache_key = hashlib.md5(claim.encode()).hexdigest()
-    if not os.environ.get('DEVELOPMENT_MODE') and cache_key in fact_check_cache:
-        logger.info(f"Using cached fact check for claim: '{claim[:50]}...'")
-        cached_result = fact_check_cache[cache_key]
-        cached_result['cached'] = True
-        return cached_result
+    if not os.environ.get('DEVELOPMENT_MODE'):
+        with fact_check_cache_lock:
+            cached_result = fact_check_cache.get(claim)
+        if cached_result is not None:
+            logger.info(f"Using cached fact check for claim: '{claim[:50]}...'")
+            return {**cached_result, 'cached': True}
     
     logger.info(f"Checking facts for claim: '{claim[:50]}...' (Request ID: {request_id})")
     
@@ -77,9 +85,16 @@ def check_facts(claim, request_id=None):
         'cached': False
     }
     
+    # The services are independent, so query them concurrently and collect
+    # the results below; total latency is that of the slowest service
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        google_future = executor.submit(check_google_fact_check_api, claim)
+        claimbuster_future = executor.submit(check_claimbuster_api, claim)
+        custom_future = executor.submit(perform_custom_verification, claim)
+    
     # 1. Try Google Fact Check API
     try:
-        google_results = check_google_fact_check_api(claim)
+        google_results = google_future.result()
         if google_results:
             results['google_fact_check'] = google_results
             logger.info(f"Found {len(google_results)} Google Fact Check results")
@@ -90,7 +105,7 @@ def check_facts(claim, request_id=None):
     
     # 2. Try ClaimBuster API (if available)
     try:
-        claimbuster_results = check_claimbuster_api(claim)
+        claimbuster_results = claimbuster_future.result()
         if claimbuster_results:
             results['claim_buster'] = claimbuster_results
             logger.info(f"ClaimBuster score: {claimbuster_results.get('score', 'N/A')}")
@@ -101,7 +116,7 @@ def check_facts(claim, request_id=None):
     
     # 3. Perform custom verification using NLP and web search
     try:
-        custom_results = perform_custom_verification(claim)
+        custom_results = custom_future.result()
         if custom_results:
             results['custom_verification'] = custom_results
             logger.info(f"Custom verification completed with confidence: {custom_results.get('confidence', 'N/A')}")
@@ -118,7 +133,8 @@ def check_facts(claim, request_id=None):
     
     # Cache the result (only if successful)
     if results['status'] == 'success' or results['status'] == 'partial':
-        fact_check_cache[cache_key] = results
+        with fact_check_cache_lock:
+            fact_check_cache[claim] = results
     
     return results
 
@@ -132,7 +148,8 @@ def check_google_fact_check_api(claim):
     Returns:
         list: List of fact check results from Google Fact Check API
     """
-    # TODO: Implement actual Google Fact Check API integration
+    # TODO: Implement actual Google Fact Check API integration using the
+    # pooled utils.http_client.http_session
     # For now, return mock data with a note that this is a placeholder
     logger.info("Using mock Google Fact Check API data (API integration pending)")
     
@@ -160,7 +177,8 @@ def check_claimbuster_api(claim):
     Returns:
         dict: ClaimBuster API results
     """
-    # TODO: Implement actual ClaimBuster API integration
+    # TODO: Implement actual ClaimBuster API integration using the pooled
+    # utils.http_client.http_session
     # For now, return mock data with a note that this is a placeholder
     logger.info("Using mock ClaimBuster API data (API integration pending)")
     
@@ -182,31 +200,17 @@ def perform_custom_verification(claim):
     """
     # Implement a basic verification using cosine similarity with known facts
     # In a real implementation, this would search trusted sources and compare
-    
-    # For demonstration, we'll use a simple approach with pre-defined facts
-    known_facts = [
-        "The Earth orbits around the Sun",
-        "Water boils at 100 degrees Celsius at sea level",
-        "The human body has 206 bones",
-        "Mount Everest is the tallest mountain on Earth",
-        "The Great Wall of China is visible from space"
-    ]
-    
-    if model:
+    if get_sentence_model():
         try:
-            # Encode the claim
-            claim_embedding = model.encode([claim])[0]
-            
-            # Encode known facts
-            fact_embeddings = model.encode(known_facts)
+            # Encode the claim; known fact embeddings are computed only once
+            claim_embedding = encode_texts([claim])[0]
             
-            # Calculate similarities
-            similarities = cosine_similarity([claim_embedding], fact_embeddings)[0]
+            similarities = get_known_fact_embeddings() @ claim_embedding
             
             # Find the most similar fact and its similarity score
             max_similarity_idx = similarities.argmax()
             max_similarity = similarities[max_similarity_idx]
-            most_similar_fact = known_facts[max_similarity_idx]
+            most_similar_fact = KNOWN_FACTS[max_similarity_idx]
             
             # Determine confidence based on similarity
             if max_similarity > 0.8:
@@ -0,0 +1,289 @@
+import os
+import logging
+import hashlib
+from collections import OrderedDict
+from functools import lru_cache
+import queue
+from concurrent.futures import Future
+from threading import Lock, Thread
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Sentence embedding model shared by fact checking and scoring
+SENTENCE_MODEL_NAME = 'all-MiniLM-L6-v2'
+
+# Token limit for embedding inputs; attention cost grows quadratically with
+# length and short evidence snippets rarely need more
+MAX_SEQ_LENGTH = 128
+
+# Texts are cut to roughly MAX_SEQ_LENGTH tokens (~4 characters per token)
+# before tokenizing, so long evidence isn't fully tokenized only to be truncated
+MAX_TEXT_CHARS = MAX_SEQ_LENGTH * 4
+
+# Texts per forward pass; larger batches keep GPU tensor cores busy
+ENCODE_BATCH_SIZE = 64
+
+# Process-wide LRU cache of embeddings, keyed by a BLAKE2 digest of the text
+EMBEDDING_CACHE_SIZE = 4096
+embedding_cache = OrderedDict()
+embedding_cache_lock = Lock()
+
+# Intra-op threads for CPU inference; lower this when running several
+# workers per machine to avoid oversubscribing cores
+TORCH_NUM_THREADS = int(os.environ.get('TORCH_NUM_THREADS', os.cpu_count() or 1))
+
+# Embedding backend: 'torch' (SentenceTransformer) or 'onnx' (int8 ONNX Runtime)
+EMBEDDING_BACKEND = os.environ.get('EMBEDDING_BACKEND', 'torch').lower()
+
+# Directory holding the quantized ONNX export of SENTENCE_MODEL_NAME
+ONNX_MODEL_DIR = os.environ.get(
+    'ONNX_MODEL_DIR',
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), 'models', 'onnx-int8')
+)
+
+class OnnxSentenceEncoder:
+    """
+    Sentence encoder backed by a dynamically quantized int8 ONNX model
+
+    Mirrors the subset of the SentenceTransformer API used by the services:
+    tokenize, run the ONNX Runtime session, mean-pool over the attention mask
+    and optionally L2-normalize.
+    """
+
+    def __init__(self, model_dir, max_seq_length=256):
+        # optimum is only needed for this backend, so import it lazily
+        from optimum.onnxruntime import ORTModelForFeatureExtraction
+        from transformers import AutoTokenizer
+
+        self.tokenizer = AutoTokenizer.from_pretrained(f"sentence-transformers/{SENTENCE_MODEL_NAME}")
+        self.session = ORTModelForFeatureExtraction.from_pretrained(
+            model_dir,
+            file_name='model_quantized.onnx',
+            provider='CPUExecutionProvider'
+        )
+        self.max_seq_length = max_seq_length
+
+    def encode(self, texts, batch_size=32, convert_to_numpy=True, normalize_embeddings=False):
+        batches = []
+        for start in range(0, len(texts), batch_size):
+            inputs = self.tokenizer(
+                texts[start:start + batch_size],
+                padding=True,
+                truncation=True,
+                max_length=self.max_seq_length,
+                return_tensors='np'
+            )
+            token_embeddings = self.session(**inputs).last_hidden_state
+
+            # Mean pooling over real (non-padding) tokens, as SBERT does
+            mask = inputs['attention_mask'][..., np.newaxis].astype(np.float32)
+            embeddings = (token_embeddings * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            batches.append(embeddings.astype(np.float32))
+
+        embeddings = np.concatenate(batches) if batches else np.empty((0, 0), dtype=np.float32)
+        if normalize_embeddings and len(embeddings):
+            embeddings /= np.clip(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12, None)
+        return embeddings
+
+def export_quantized_onnx_model(model_dir):
+    """
+    Export SENTENCE_MODEL_NAME to ONNX and apply dynamic int8 quantization
+
+    Args:
+        model_dir (str): Directory to write model_quantized.onnx and its config to
+    """
+    from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+    logger.info(f"Exporting quantized ONNX NLP model to {model_dir}")
+    onnx_model = ORTModelForFeatureExtraction.from_pretrained(f"sentence-transformers/{SENTENCE_MODEL_NAME}", export=True)
+    quantizer = ORTQuantizer.from_pretrained(onnx_model)
+    quantizer.quantize(
+        save_dir=model_dir,
+        quantization_config=AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+    )
+    onnx_model.config.save_pretrained(model_dir)
+
+# Serializes the first load so concurrent claims don't each load a copy
+model_lock = Lock()
+
+def get_sentence_model():
+    """
+    Get the shared sentence embedding model, loading it on first use
+
+    The model (and torch itself) is only imported when first needed, so
+    endpoints that never embed text don't pay the startup time or memory.
+
+    Returns:
+        SentenceTransformer or OnnxSentenceEncoder: The shared model, or None if
+        it could not be loaded
+    """
+    with model_lock:
+        return load_sentence_model()
+
+@lru_cache(maxsize=1)
+def load_sentence_model():
+    """Load the sentence embedding model; cached so it runs once per process"""
+    if EMBEDDING_BACKEND == 'onnx':
+        try:
+            if not os.path.exists(os.path.join(ONNX_MODEL_DIR, 'model_quantized.onnx')):
+                export_quantized_onnx_model(ONNX_MODEL_DIR)
+            model = OnnxSentenceEncoder(ONNX_MODEL_DIR, max_seq_length=MAX_SEQ_LENGTH)
+            logger.info(f"Quantized ONNX NLP model loaded from {ONNX_MODEL_DIR}")
+            return model
+        except Exception as e:
+            logger.error(f"Error loading ONNX NLP model, falling back to PyTorch: {str(e)}")
+
+    try:
+        import torch
+        from sentence_transformers import SentenceTransformer
+
+        torch.set_num_threads(TORCH_NUM_THREADS)
+        try:
+            torch.set_num_interop_threads(2)
+        except RuntimeError:
+            # Only allowed before torch has started any inter-op work
+            pass
+
+        # Run on the GPU in half precision when one is available
+        device = 'cuda' if torch.cuda.is_available() else 'cpu'
+        model = SentenceTransformer(SENTENCE_MODEL_NAME, device=device)
+        if device == 'cuda':
+            model.half()
+        model.max_seq_length = MAX_SEQ_LENGTH
+        model.eval()
+        logger.info(f"NLP model loaded successfully on {device}")
+        return model
+    except Exception as e:
+        logger.error(f"Error loading NLP model: {str(e)}")
+        return None
+
+def run_model(texts):
+    """Run one batched forward pass of the shared model over texts"""
+    import torch
+
+    model = get_sentence_model()
+    with torch.inference_mode():
+        embeddings = model.encode(texts, batch_size=ENCODE_BATCH_SIZE, convert_to_numpy=True, normalize_embeddings=True)
+    # FP16 models return half-precision vectors; similarity math runs in float32
+    embeddings = embeddings.astype(np.float32)
+    # Embeddings end up shared through the cache, so make them read-only
+    embeddings.flags.writeable = False
+    return embeddings
+
+class EmbeddingBatcher:
+    """
+    Coalesces concurrent encode requests into shared model batches
+
+    Claims are verified on several threads at once. Instead of each thread
+    running its own small forward pass, callers queue their texts and wait;
+    a single worker thread takes every request already queued (up to
+    max_batch_size texts), runs one forward pass over their distinct texts
+    and hands each caller its rows. It never waits for more requests, so an
+    idle server encodes immediately, while under load the requests that
+    arrive during one forward pass form the next batch.
+    """
+
+    def __init__(self, max_batch_size=ENCODE_BATCH_SIZE):
+        self.max_batch_size = max_batch_size
+        self.requests = queue.Queue()
+        self.worker = None
+        self.worker_lock = Lock()
+
+    def encode(self, texts):
+        future = Future()
+        self.requests.put((texts, future))
+        self.start_worker()
+        return future.result()
+
+    def start_worker(self):
+        # Started on first use rather than at import, so forked server
+        # workers each get their own thread
+        with self.worker_lock:
+            if self.worker is None or not self.worker.is_alive():
+                self.worker = Thread(target=self.run, name='embedding-batcher', daemon=True)
+                self.worker.start()
+
+    def run(self):
+        while True:
+            pending = [self.requests.get()]
+            text_count = len(pending[0][0])
+            while text_count < self.max_batch_size:
+                try:
+                    request = self.requests.get_nowait()
+                except queue.Empty:
+                    break
+                pending.append(request)
+                text_count += len(request[0])
+
+            # Callers often share texts (e.g. the same claim), so encode each once
+            unique_texts = {}
+            for texts, _ in pending:
+                for text in texts:
+                    unique_texts.setdefault(text, len(unique_texts))
+
+            try:
+                embeddings = run_model(list(unique_texts))
+            except Exception as e:
+                for _, future in pending:
+                    future.set_exception(e)
+                continue
+
+            for texts, future in pending:
+                rows = embeddings[[unique_texts[text] for text in texts]]
+                rows.flags.writeable = False
+                future.set_result(rows)
+
+# Shared batcher through which all model inference in the process runs
+embedding_batcher = EmbeddingBatcher()
+
+def encode_texts(texts):
+    """
+    Encode texts into L2-normalized embeddings with the shared model
+
+    Because the embeddings are L2-normalized, the cosine similarity of two
+    texts is simply the dot product of their embeddings. The model is loaded
+    lazily on first use (see get_sentence_model).
+
+    Embeddings are kept in a process-wide LRU cache, so only texts that have
+    not been seen recently are sent through the model, batched together with
+    concurrent calls from other threads.
+
+    Args:
+        texts (list): The texts to encode
+
+    Returns:
+        numpy.ndarray: One normalized embedding per text
+    """
+    if not texts:
+        return np.empty((0, 0), dtype=np.float32)
+
+    texts = [text[:MAX_TEXT_CHARS] for text in texts]
+    keys = [hashlib.blake2b(text.encode(), digest_size=16).digest() for text in texts]
+
+    embeddings = [None] * len(texts)
+    with embedding_cache_lock:
+        for i, key in enumerate(keys):
+            embedding = embedding_cache.get(key)
+            if embedding is not None:
+                embedding_cache.move_to_end(key)
+                embeddings[i] = embedding
+
+    # Encode each distinct uncached text once
+    missing = {}
+    for i, embedding in enumerate(embeddings):
+        if embedding is None:
+            missing.setdefault(keys[i], texts[i])
+
+    if missing:
+        encoded = embedding_batcher.encode(list(missing.values()))
+        new_embeddings = dict(zip(missing, encoded))
+        with embedding_cache_lock:
+            embedding_cache.update(new_embeddings)
+            while len(embedding_cache) > EMBEDDING_CACHE_SIZE:
+                embedding_cache.popitem(last=False)
+        embeddings = [new_embeddings[key] if embedding is None else embedding
+                      for key, embedding in zip(keys, embeddings)]
+
+    return np.stack(embeddings)
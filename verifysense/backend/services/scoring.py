@@ -1,25 +1,23 @@
 import logging
 import numpy as np
-from datetime import datetime
 import re
 import os
-import json
-import hashlib
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
-from textblob import TextBlob
-
-# Setup logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+import sys
+import uuid
+from functools import lru_cache
+from threading import Lock
+import tldextract
+from services.nlp_models import get_sentence_model, encode_texts
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
 logger = logging.getLogger(__name__)
 
-# Initialize sentence transformer model for semantic similarity
-try:
-    model = SentenceTransformer('distilbert-base-nli-mean-tokens')
-    logger.info("NLP model loaded successfully")
-except Exception as e:
-    logger.error(f"Error loading NLP model: {str(e)}")
-    model = None
+# Lexicon-based sentiment analyzer; compound scores lie in [-1, 1]
+sentiment_analyzer = SentimentIntensityAnalyzer()
+
+# Registered-domain extractor backed by the bundled public suffix list;
+# no network fetch or disk cache at startup
+domain_extractor = tldextract.TLDExtract(cache_dir=None, suffix_list_urls=())
 
 # Source reliability database - can be expanded or moved to a separate file
 SOURCE_RELIABILITY = {
@@ -42,6 +40,115 @@ SOURCE_RELIABILITY = {
     'snopes.com': 0.8,
 }
 
+# Intern the domain keys; extract_domain returns interned strings too, so
+# lookups match on identity without a full string comparison
+SOURCE_RELIABILITY = {sys.intern(domain): reliability for domain, reliability in SOURCE_RELIABILITY.items()}
+
+# Scores for known fact-check rating phrases
+RATING_SCORES = {
+    'pants on fire': 20,
+    'false': 20,
+    'mostly false': 30,
+    'misleading': 30,
+    'half true': 50,
+    'mixture': 50,
+    'mixed': 50,
+    'mostly true': 70,
+    'true': 90,
+}
+
+# Single-pass matcher for the rating phrases; longer phrases are tried first
+# so that e.g. 'mostly false' is not read as 'false'
+RATING_PATTERN = re.compile('|'.join(
+    re.escape(phrase) for phrase in sorted(RATING_SCORES, key=len, reverse=True)
+))
+
+# Exact rating vocabularies of individual fact-checkers, keyed by publisher
+# domain; ratings not listed fall back to RATING_PATTERN
+PUBLISHER_RATINGS = {
+    'politifact.com': {
+        'true': 90,
+        'mostly true': 70,
+        'half true': 50,
+        'mostly false': 30,
+        'false': 20,
+        'pants on fire': 20,
+        'pants on fire!': 20,
+    },
+    'snopes.com': {
+        'true': 90,
+        'correct attribution': 90,
+        'mostly true': 70,
+        'mixture': 50,
+        'unproven': 50,
+        'outdated': 50,
+        'mostly false': 30,
+        'miscaptioned': 30,
+        'misattributed': 30,
+        'unfounded': 30,
+        'false': 20,
+        'fake': 20,
+        'scam': 20,
+        'labeled satire': 50,
+    },
+}
+
+# Cross-source consistency score by number of high-reliability sources:
+# 0 -> 40, 1 -> 60, 2 -> 75, 3 or more -> 90
+CROSS_SOURCE_THRESHOLDS = [1, 2, 3]
+CROSS_SOURCE_SCORES = [40, 60, 75, 90]
+
+# Near-duplicate claims (cosine similarity at least SCORE_CACHE_SIMILARITY)
+# with the same fact-check ratings, scored against the same evidence URLs,
+# reuse the earlier result
+SCORE_CACHE_SIZE = 1000
+SCORE_CACHE_SIMILARITY = 0.95
+
+class SemanticScoreCache:
+    """
+    Bounded cache of recent score results, looked up by claim embedding
+
+    Claim embeddings are kept as rows of one preallocated matrix, so a lookup
+    is a single matrix-vector product against every cached claim. Entries are
+    overwritten oldest first once max_size claims are stored.
+    """
+
+    def __init__(self, max_size=SCORE_CACHE_SIZE, threshold=SCORE_CACHE_SIMILARITY):
+        self.max_size = max_size
+        self.threshold = threshold
+        self.embeddings = None
+        self.entries = [None] * max_size
+        self.count = 0
+        self.next_slot = 0
+        self.lock = Lock()
+
+    def get(self, claim_embedding, evidence_urls, fact_check_key):
+        """
+        Return the result of the most similar cached claim with the same
+        fact-check ratings and evidence URLs, or None
+        """
+        with self.lock:
+            if not self.count:
+                return None
+            similarities = self.embeddings[:self.count] @ claim_embedding
+            candidates = np.flatnonzero(similarities >= self.threshold)
+            for slot in candidates[np.argsort(-similarities[candidates])]:
+                cached_urls, cached_fact_check_key, result = self.entries[slot]
+                if cached_fact_check_key == fact_check_key and cached_urls == evidence_urls:
+                    return result
+        return None
+
+    def put(self, claim_embedding, evidence_urls, fact_check_key, result):
+        with self.lock:
+            if self.embeddings is None:
+                self.embeddings = np.empty((self.max_size, len(claim_embedding)), dtype=np.float32)
+            self.embeddings[self.next_slot] = claim_embedding
+            self.entries[self.next_slot] = (evidence_urls, fact_check_key, result)
+            self.next_slot = (self.next_slot + 1) % self.max_size
+            self.count = min(self.count + 1, self.max_size)
+
+score_cache = SemanticScoreCache()
+
 def calculate_score(claim, fact_checks, evidence, request_id=None):
     """
     Calculate a credibility score for a claim based on fact checks and evidence
@@ -49,9 +156,9 @@ def calculate_score(claim, fact_checks, evidence, request_id=None):
     """
     # Generate request ID if not provided
     if not request_id:
-        request_id = hashlib.md5(f"{claim}_{datetime.now().isoformat()}".encode()).hexdigest()
+        request_id = uuid.uuid4().hex
     
-    logger.info(f"Calculating score for claim: '{claim[:50]}...' (Request ID: {request_id})")
+    logger.info("Calculating score for claim: '%s...' (Request ID: %s)", claim[:50], request_id)
     
     # Initialize score components
     scores = {
@@ -65,9 +172,11 @@ def calculate_score(claim, fact_checks, evidence, request_id=None):
     }
 
     # 1. Fact Check Score
+    # (rating, publisher domain) pairs; the fact-check part of the score cache key
+    fact_check_key = []
     if fact_checks:
-        fact_check_scores = []
-        for check in fact_checks:
+        fact_check_scores = np.empty(len(fact_checks))
+        for i, check in enumerate(fact_checks):
             if isinstance(check, dict):
                 rating = check.get('rating', '').lower()
                 publisher = check.get('publisher', {}).get('name', '')
@@ -78,105 +187,104 @@ def calculate_score(claim, fact_checks, evidence, request_id=None):
                 publisher = ''
                 url = str(check)
             
-            logger.info(f"Fact check from {publisher or url}: Rating '{rating}'")
-
-            # Convert rating to numerical score
-            if 'false' in rating or 'pants on fire' in rating:
-                score = 20
-            elif 'mostly false' in rating or 'misleading' in rating:
-                score = 30
-            elif 'half true' in rating or 'mixture' in rating or 'mixed' in rating:
-                score = 50
-            elif 'mostly true' in rating:
-                score = 70
-            elif 'true' in rating:
-                score = 90
-            else:
-                score = 50  # Neutral
+            logger.info("Fact check from %s: Rating '%s'", publisher or url, rating)
 
-            # Publisher reliability
+            # Convert rating to numerical score using the publisher's vocabulary
             publisher_domain = extract_domain(url)
+            score = rating_to_score(rating, publisher_domain)
+            fact_check_key.append((rating, publisher_domain))
+
+            # Publisher reliability
             publisher_reliability = SOURCE_RELIABILITY.get(publisher_domain, 0.7)
-            weighted_score = score * publisher_reliability
-            fact_check_scores.append(weighted_score)
+            fact_check_scores[i] = score * publisher_reliability
 
-        if fact_check_scores:
-            scores['fact_check_score'] = sum(fact_check_scores) / len(fact_check_scores)
+        scores['fact_check_score'] = float(fact_check_scores.mean())
+    fact_check_key = tuple(sorted(fact_check_key))
 
-    # 2. Source Reliability Score
-    if evidence:
-        reliability_scores = []
-        for item in evidence:
-            if isinstance(item, dict):
-                source_url = item.get('url', '')
-            else:
-                source_url = str(item)
-            
-            domain = extract_domain(source_url)
-            reliability = SOURCE_RELIABILITY.get(domain, 0.6)
-            reliability_scores.append(reliability * 100)
-            logger.info(f"Source reliability for {domain}: {reliability * 100}")
-        
-        if reliability_scores:
-            scores['source_reliability_score'] = sum(reliability_scores) / len(reliability_scores)
-
-    # 3. Semantic Similarity Score
-    if model and evidence:
+    # Reuse the result of a near-duplicate claim scored with the same fact
+    # checks against the same evidence, before any per-evidence work. Only
+    # done when the evidence has content, i.e. when the semantic similarity
+    # pass below needs the model anyway.
+    evidence_urls = frozenset(
+        item.get('url', '') if isinstance(item, dict) else str(item) for item in evidence or []
+    )
+    has_content = any(item.get('content') if isinstance(item, dict) else item for item in evidence or [])
+    cache_embedding = None
+    cache_result = False
+    if has_content and not os.environ.get('DEVELOPMENT_MODE') and get_sentence_model():
         try:
-            claim_embedding = model.encode([claim])[0]
-            similarity_scores = []
-            for item in evidence:
-                content = ''
-                if isinstance(item, dict):
-                    content = item.get('content', '')
-                else:
-                    content = str(item)
-                if content:
-                    content_sample = content[:1000]
-                    content_embedding = model.encode([content_sample])[0]
-                    similarity = cosine_similarity([claim_embedding], [content_embedding])[0][0]
-                    similarity_scores.append((similarity + 1) * 50)
-                    logger.info(f"Semantic similarity score: {(similarity + 1) * 50:.2f}")
-            if similarity_scores:
-                scores['semantic_similarity_score'] = sum(similarity_scores) / len(similarity_scores)
+            # Kept in the encode_texts cache, so the batch below reuses it
+            cache_embedding = encode_texts([claim])[0]
+            cached_result = score_cache.get(cache_embedding, evidence_urls, fact_check_key)
+            if cached_result:
+                logger.info("Using cached score for near-duplicate claim (Request ID: %s)", request_id)
+                return {
+                    **cached_result,
+                    'components': dict(cached_result['components']),
+                    'request_id': request_id,
+                    'cached': True
+                }
         except Exception as e:
-            logger.error(f"Error calculating semantic similarity: {str(e)}")
+            logger.error("Error looking up cached score: %s", e)
 
-    # 4. Sentiment Consistency Score
     if evidence:
-        claim_sentiment = TextBlob(claim).sentiment.polarity
-        sentiment_scores = []
-        for item in evidence:
-            content = ''
+        # Walk the evidence once, collecting the per-item statistics used by
+        # the reliability, similarity, sentiment and cross-source scores
+        claim_sentiment = sentiment_analyzer.polarity_scores(claim)['compound']
+        reliabilities = np.empty(len(evidence))
+        content_samples = []
+        sentiment_scores = np.empty(len(evidence))
+        sentiment_count = 0
+        for i, item in enumerate(evidence):
             if isinstance(item, dict):
+                source_url = item.get('url', '')
                 content = item.get('content', '')
             else:
-                content = str(item)
+                source_url = content = str(item)
+            
+            domain = extract_domain(source_url)
+            reliability = SOURCE_RELIABILITY.get(domain, 0.6)
+            reliabilities[i] = reliability
+            logger.info("Source reliability for %s: %s", domain, reliability * 100)
+            
             if content:
-                evidence_sentiment = TextBlob(content[:1000]).sentiment.polarity
+                content_sample = content[:1000]
+                content_samples.append(content_sample)
+                evidence_sentiment = sentiment_analyzer.polarity_scores(content_sample)['compound']
                 consistency_score = 100 - abs(claim_sentiment - evidence_sentiment) * 50
-                sentiment_scores.append(consistency_score)
-                logger.info(f"Sentiment consistency score: {consistency_score:.2f}")
-        if sentiment_scores:
-            scores['sentiment_consistency_score'] = sum(sentiment_scores) / len(sentiment_scores)
+                sentiment_scores[sentiment_count] = consistency_score
+                sentiment_count += 1
+                logger.info("Sentiment consistency score: %.2f", consistency_score)
 
-    # 5. Cross-Source Consistency
-    if evidence:
-        high_reliability_sources = sum(
-            1 for item in evidence
-            if SOURCE_RELIABILITY.get(
-                extract_domain(item.get('url', '') if isinstance(item, dict) else str(item)), 0
-            ) > 0.8
-        )
-        if high_reliability_sources >= 3:
-            scores['cross_source_consistency_score'] = 90
-        elif high_reliability_sources >= 2:
-            scores['cross_source_consistency_score'] = 75
-        elif high_reliability_sources >= 1:
-            scores['cross_source_consistency_score'] = 60
-        else:
-            scores['cross_source_consistency_score'] = 40
-        logger.info(f"Cross-source consistency score: {scores['cross_source_consistency_score']} (from {high_reliability_sources} high-reliability sources)")
+        # 2. Source Reliability Score
+        scores['source_reliability_score'] = float(reliabilities.mean() * 100)
+
+        # 3. Semantic Similarity Score
+        if content_samples and get_sentence_model():
+            try:
+                # Encode the claim and all evidence in a single batch
+                embeddings = encode_texts([claim] + content_samples)
+                claim_embedding, content_embeddings = embeddings[0], embeddings[1:]
+                similarity_scores = (content_embeddings @ claim_embedding + 1) * 50
+                if logger.isEnabledFor(logging.DEBUG):
+                    for similarity_score in similarity_scores:
+                        logger.debug("Semantic similarity score: %.2f", similarity_score)
+                scores['semantic_similarity_score'] = float(similarity_scores.mean())
+                cache_result = cache_embedding is not None
+            except Exception as e:
+                logger.error("Error calculating semantic similarity: %s", e)
+
+        # 4. Sentiment Consistency Score
+        if sentiment_count:
+            scores['sentiment_consistency_score'] = float(sentiment_scores[:sentiment_count].mean())
+
+        # 5. Cross-Source Consistency
+        high_reliability_sources = int((reliabilities > 0.8).sum())
+        scores['cross_source_consistency_score'] = CROSS_SOURCE_SCORES[
+            np.searchsorted(CROSS_SOURCE_THRESHOLDS, high_reliability_sources, side='right')
+        ]
+        logger.info("Cross-source consistency score: %s (from %d high-reliability sources)",
+                    scores['cross_source_consistency_score'], high_reliability_sources)
 
     # 6. Temporal Relevance
     scores['temporal_relevance_score'] = 70
@@ -206,36 +314,42 @@ def calculate_score(claim, fact_checks, evidence, request_id=None):
     else:
         confidence_label = 'Mixed / Needs Verification'
 
-    logger.info(f"Final score: {final_score} ({confidence_label})")
-    logger.info(f"Score components: {json.dumps(scores)}")
+    logger.info("Final score: %s (%s)", final_score, confidence_label)
+    logger.debug("Score components: %s", scores)
 
-    return {
+    result = {
         'score': final_score,
         'confidence_label': confidence_label,
         'components': scores,
         'request_id': request_id
     }
+    if cache_result:
+        score_cache.put(cache_embedding, evidence_urls, fact_check_key, {**result, 'components': dict(scores)})
+    return result
+
 
+def rating_to_score(rating, publisher_domain=''):
+    """
+    Convert a lowercase fact-check rating to a numerical score (50 if unrecognized)
+
+    Ratings from publishers in PUBLISHER_RATINGS are looked up exactly in that
+    publisher's vocabulary; anything else is matched against RATING_PATTERN.
+    """
+    publisher_ratings = PUBLISHER_RATINGS.get(publisher_domain)
+    if publisher_ratings:
+        score = publisher_ratings.get(rating.strip())
+        if score is not None:
+            return score
 
+    match = RATING_PATTERN.search(rating)
+    return RATING_SCORES[match.group()] if match else 50
+
+
+@lru_cache(maxsize=8192)
 def extract_domain(url):
-    """Extract domain from URL"""
+    """Extract registered domain from URL (e.g. bbc.co.uk from https://www.bbc.co.uk/news)"""
     if not url:
         return ""
     
-    # Remove protocol and www
-    domain = re.sub(r'^https?://(www\.)?', '', url.lower())
-    
-    # Get domain part (before path)
-    domain = domain.split('/')[0]
-    
-    # Extract base domain (e.g., example.com from sub.example.com)
-    parts = domain.split('.')
-    if len(parts) > 2:
-        # Check for country code TLDs like .co.uk
-        if parts[-2] in ['co', 'com', 'org', 'net', 'edu', 'gov', 'mil'] and len(parts[-1]) == 2:
-            return '.'.join(parts[-3:])
-        else:
-            return '.'.join(parts[-2:])
-    
-    return domain
-    
\ No newline at end of file
+    result = domain_extractor(url.lower())
+    return sys.intern(f"{result.domain}.{result.suffix}" if result.suffix else result.domain)
@@ -1,7 +1,8 @@
 import requests
 import json
-import time
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 
 # Test configuration
 BASE_URL = "http://localhost:5000"
@@ -15,21 +16,30 @@ TEST_CONTENT = [
     "Climate change is a hoax created by scientists for funding.",
     "Drinking water with lemon every morning can cure cancer."
 ]
+MAX_CONCURRENT_REQUESTS = 8
 
-def test_url_verification():
-    """Test verification with different URLs"""
-    print("\n=== Testing URL Verification ===")
+# Shared session so concurrent requests reuse keep-alive connections
+session = requests.Session()
+session.mount("http://", HTTPAdapter(pool_connections=16, pool_maxsize=MAX_CONCURRENT_REQUESTS))
+
+def post_verification(payload):
+    """Send a verification request, returning the response or the raised exception"""
+    try:
+        return session.post(f"{BASE_URL}/api/verify", json=payload)
+    except Exception as e:
+        return e
+
+def run_verifications(label, inputs, payloads):
+    """Send all verification requests concurrently and print results in input order"""
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        responses = list(executor.map(post_verification, payloads))
     
-    for url in TEST_URLS:
-        print(f"\nTesting URL: {url}")
-        
-        payload = {
-            "url": url,
-            "type": "text"
-        }
+    for value, response in zip(inputs, responses):
+        print(f"\nTesting {label}: {value}")
         
         try:
-            response = requests.post(f"{BASE_URL}/api/verify", json=payload)
+            if isinstance(response, Exception):
+                raise response
             response_data = response.json()
             
             print(f"Status Code: {response.status_code}")
@@ -60,57 +70,20 @@ def test_url_verification():
                 
         except Exception as e:
             print(f"Error during test: {str(e)}")
-        
-        # Wait between requests to avoid overwhelming the server
-        time.sleep(1)
+
+def test_url_verification():
+    """Test verification with different URLs"""
+    print("\n=== Testing URL Verification ===")
+    
+    payloads = [{"url": url, "type": "text"} for url in TEST_URLS]
+    run_verifications("URL", TEST_URLS, payloads)
 
 def test_content_verification():
     """Test verification with direct content input"""
     print("\n=== Testing Content Verification ===")
     
-    for content in TEST_CONTENT:
-        print(f"\nTesting Content: {content}")
-        
-        payload = {
-            "content": content,
-            "type": "text"
-        }
-        
-        try:
-            response = requests.post(f"{BASE_URL}/api/verify", json=payload)
-            response_data = response.json()
-            
-            print(f"Status Code: {response.status_code}")
-            print(f"Response Status: {response_data.get('status')}")
-            
-            if response.status_code == 200:
-                results = response_data.get('results', [])
-                print(f"Claims detected: {len(results)}")
-                
-                for i, result in enumerate(results):
-                    print(f"\nClaim {i+1}: {result.get('claim')}")
-                    print(f"Confidence: {result.get('score', {}).get('confidence_label')}")
-                    print(f"Score: {result.get('score', {}).get('score')}")
-                    
-                    # Print score components
-                    components = result.get('score', {}).get('components', {})
-                    if components:
-                        print("Score Components:")
-                        for component, value in components.items():
-                            print(f"  - {component}: {value}")
-                    
-                    # Check for notifications
-                    notification = result.get('notification')
-                    if notification:
-                        print(f"Notification: {notification.get('message')}")
-            else:
-                print(f"Error: {response_data.get('message')}")
-                
-        except Exception as e:
-            print(f"Error during test: {str(e)}")
-        
-        # Wait between requests to avoid overwhelming the server
-        time.sleep(1)
+    payloads = [{"content": content, "type": "text"} for content in TEST_CONTENT]
+    run_verifications("Content", TEST_CONTENT, payloads)
 
 def test_image_verification():
     """Test verification with image input (should return notification)"""
@@ -122,7 +95,7 @@ def test_image_verification():
     }
     
     try:
-        response = requests.post(f"{BASE_URL}/api/verify", json=payload)
+        response = session.post(f"{BASE_URL}/api/verify", json=payload)
         response_data = response.json()
         
         print(f"Status Code: {response.status_code}")
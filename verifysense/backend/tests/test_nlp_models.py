@@ -0,0 +1,40 @@
+import unittest
+import os
+import sys
+import numpy as np
+from unittest.mock import patch
+
+# Add the parent directory to the path so we can import the services
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services import nlp_models
+
+class TestEncodeTexts(unittest.TestCase):
+    @patch('services.nlp_models.run_model')
+    def test_encode_texts_cache(self, mock_run_model):
+        mock_run_model.side_effect = lambda texts: np.ones((len(texts), 4), dtype=np.float32)
+        nlp_models.embedding_cache.clear()
+        
+        first = nlp_models.encode_texts(["cached text", "other text", "cached text"])
+        second = nlp_models.encode_texts(["cached text", "new text"])
+        
+        # Assertions
+        self.assertEqual(first.shape, (3, 4))
+        self.assertEqual(second.shape, (2, 4))
+        self.assertEqual(mock_run_model.call_args_list[0][0][0], ["cached text", "other text"])
+        self.assertEqual(mock_run_model.call_args_list[1][0][0], ["new text"])
+
+class TestEmbeddingBatcher(unittest.TestCase):
+    @patch('services.nlp_models.run_model')
+    def test_embedding_batcher_dedupes_texts(self, mock_run_model):
+        mock_run_model.side_effect = lambda texts: np.arange(len(texts) * 2, dtype=np.float32).reshape(-1, 2)
+        batcher = nlp_models.EmbeddingBatcher()
+        
+        result = batcher.encode(["claim", "evidence", "claim"])
+        
+        # Assertions
+        mock_run_model.assert_called_once_with(["claim", "evidence"])
+        self.assertEqual(result.tolist(), [[0, 1], [2, 3], [0, 1]])
+
+if __name__ == "__main__":
+    unittest.main()
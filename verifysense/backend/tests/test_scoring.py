@@ -0,0 +1,61 @@
+import unittest
+import os
+import sys
+import numpy as np
+
+# Add the parent directory to the path so we can import the services
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.scoring import extract_domain, rating_to_score, SemanticScoreCache
+
+class TestExtractDomain(unittest.TestCase):
+    def test_extract_domain(self):
+        self.assertEqual(extract_domain("https://www.bbc.com/news/health-68274002"), "bbc.com")
+        self.assertEqual(extract_domain("https://news.bbc.co.uk/2/hi/123.stm"), "bbc.co.uk")
+        self.assertEqual(extract_domain("http://WWW.Reuters.com"), "reuters.com")
+        self.assertEqual(extract_domain("www3.nhk.or.jp/news"), "nhk.or.jp")
+        self.assertEqual(extract_domain(""), "")
+
+class TestRatingToScore(unittest.TestCase):
+    def test_rating_to_score(self):
+        self.assertEqual(rating_to_score("false"), 20)
+        self.assertEqual(rating_to_score("pants on fire!"), 20)
+        self.assertEqual(rating_to_score("mostly false"), 30)
+        self.assertEqual(rating_to_score("half true"), 50)
+        self.assertEqual(rating_to_score("mostly true"), 70)
+        self.assertEqual(rating_to_score("true"), 90)
+        self.assertEqual(rating_to_score("unproven"), 50)
+
+    def test_rating_to_score_publisher(self):
+        self.assertEqual(rating_to_score("pants on fire!", "politifact.com"), 20)
+        self.assertEqual(rating_to_score("miscaptioned", "snopes.com"), 30)
+        self.assertEqual(rating_to_score("miscaptioned"), 50)
+        # Unknown ratings fall back to the generic matcher
+        self.assertEqual(rating_to_score("half true", "snopes.com"), 50)
+
+class TestSemanticScoreCache(unittest.TestCase):
+    def test_semantic_score_cache(self):
+        cache = SemanticScoreCache(max_size=2)
+        claim = np.array([1.0, 0.0], dtype=np.float32)
+        near_claim = np.array([0.99, 0.141], dtype=np.float32)
+        other_claim = np.array([0.0, 1.0], dtype=np.float32)
+        fact_check_key = (("false", "politifact.com"),)
+        
+        self.assertIsNone(cache.get(claim, frozenset({"https://bbc.com/a"}), fact_check_key))
+        cache.put(claim, frozenset({"https://bbc.com/a", "https://reuters.com/b"}), fact_check_key, {"score": 80})
+        
+        # Near-duplicate claims hit only with the same fact checks and the same evidence
+        evidence_urls = frozenset({"https://reuters.com/b", "https://bbc.com/a"})
+        self.assertEqual(cache.get(near_claim, evidence_urls, fact_check_key), {"score": 80})
+        self.assertIsNone(cache.get(near_claim, frozenset({"https://bbc.com/a"}), fact_check_key))
+        self.assertIsNone(cache.get(near_claim, frozenset({"https://bbc.com/a", "https://spam.biz/c"}), fact_check_key))
+        self.assertIsNone(cache.get(near_claim, evidence_urls, (("true", "snopes.com"),)))
+        self.assertIsNone(cache.get(other_claim, evidence_urls, fact_check_key))
+        
+        # Oldest entries are evicted once the cache is full
+        cache.put(other_claim, frozenset({"https://cnn.com/c"}), (), {"score": 20})
+        cache.put(other_claim, frozenset({"https://cnn.com/d"}), (), {"score": 30})
+        self.assertIsNone(cache.get(claim, evidence_urls, fact_check_key))
+
+if __name__ == "__main__":
+    unittest.main()
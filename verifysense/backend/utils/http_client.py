@@ -0,0 +1,15 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Shared HTTP session so outbound API calls reuse pooled keep-alive
+# connections instead of opening a new TCP+TLS connection per request
+http_session = requests.Session()
+
+adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.2)
+)
+http_session.mount('https://', adapter)
+http_session.mount('http://', adapter)
@@ -1,5 +1,9 @@
 import logging
+import logging.config
 import os
+import atexit
+import queue
+from logging.handlers import QueueHandler, QueueListener
 import json
 from datetime import datetime
 
@@ -18,13 +22,38 @@ file_handler.setFormatter(formatter)
 console_handler = logging.StreamHandler()
 console_handler.setFormatter(formatter)
 
+# Records are only enqueued on the calling thread; a background listener
+# thread writes them to the file and console handlers, keeping log I/O off
+# the request path
+log_queue = queue.Queue(-1)
+queue_listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+
+# A single queue handler on the root logger. Every other logger propagates to
+# root, so each record is formatted and written exactly once.
+LOGGING_CONFIG = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'queue': {
+            '()': QueueHandler,
+            'queue': log_queue
+        }
+    },
+    'root': {
+        'level': 'INFO',
+        'handlers': ['queue']
+    }
+}
+
+logging.config.dictConfig(LOGGING_CONFIG)
+queue_listener.start()
+# Flush queued records on interpreter shutdown
+atexit.register(queue_listener.stop)
+
 # Create loggers
 def get_logger(name):
-    logger = logging.getLogger(name)
-    logger.setLevel(logging.INFO)
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
-    return logger
+    """Get a named logger; records propagate to the root handlers"""
+    return logging.getLogger(name)
 
 # Main application logger
 app_logger = get_logger('verifysense')
@@ -37,45 +66,46 @@ scoring_logger = get_logger('verifysense.scoring')
 
 def log_request(request_id, url=None, content=None, content_type=None):
     """Log incoming verification request"""
-    app_logger.info(f"New verification request: {request_id}")
+    app_logger.info("New verification request: %s", request_id)
     if url:
-        app_logger.info(f"URL: {url}")
+        app_logger.info("URL: %s", url)
     if content_type:
-        app_logger.info(f"Content type: {content_type}")
+        app_logger.info("Content type: %s", content_type)
     
 def log_extraction(request_id, extracted_content, source=None):
     """Log content extraction results"""
-    extraction_logger.info(f"Content extraction for request {request_id}")
+    extraction_logger.info("Content extraction for request %s", request_id)
     if source:
-        extraction_logger.info(f"Source: {source}")
-    extraction_logger.info(f"Extracted content length: {len(extracted_content) if extracted_content else 0}")
-    extraction_logger.debug(f"Extracted content: {extracted_content[:500]}...")
+        extraction_logger.info("Source: %s", source)
+    extraction_logger.info("Extracted content length: %d", len(extracted_content) if extracted_content else 0)
+    extraction_logger.debug("Extracted content: %.500s...", extracted_content)
 
 def log_claims(request_id, claims):
     """Log detected claims"""
-    claim_logger.info(f"Claim detection for request {request_id}")
-    claim_logger.info(f"Number of claims detected: {len(claims)}")
+    claim_logger.info("Claim detection for request %s", request_id)
+    claim_logger.info("Number of claims detected: %d", len(claims))
     for i, claim in enumerate(claims):
-        claim_logger.info(f"Claim {i+1}: {claim}")
+        claim_logger.info("Claim %d: %s", i + 1, claim)
 
 def log_factcheck(request_id, claim, verification_results):
     """Log fact-checking results"""
-    factcheck_logger.info(f"Fact-checking for request {request_id}, claim: {claim[:100]}...")
-    factcheck_logger.info(f"Verification sources used: {len(verification_results['sources']) if 'sources' in verification_results else 0}")
-    factcheck_logger.debug(f"Verification results: {json.dumps(verification_results, indent=2)}")
+    factcheck_logger.info("Fact-checking for request %s, claim: %.100s...", request_id, claim)
+    factcheck_logger.info("Verification sources used: %d", len(verification_results['sources']) if 'sources' in verification_results else 0)
+    if factcheck_logger.isEnabledFor(logging.DEBUG):
+        factcheck_logger.debug("Verification results: %s", json.dumps(verification_results, indent=2))
 
 def log_scoring(request_id, claim, score_data):
     """Log scoring results"""
-    scoring_logger.info(f"Scoring for request {request_id}, claim: {claim[:100]}...")
-    scoring_logger.info(f"Overall score: {score_data['score']}, Confidence: {score_data['confidence_label']}")
+    scoring_logger.info("Scoring for request %s, claim: %.100s...", request_id, claim)
+    scoring_logger.info("Overall score: %s, Confidence: %s", score_data['score'], score_data['confidence_label'])
     if 'components' in score_data:
         for component, value in score_data['components'].items():
-            scoring_logger.info(f"Component score - {component}: {value}")
+            scoring_logger.info("Component score - %s: %s", component, value)
 
 def log_error(request_id, error_message, error_type=None, stack_trace=None):
     """Log errors"""
-    app_logger.error(f"Error in request {request_id}: {error_message}")
+    app_logger.error("Error in request %s: %s", request_id, error_message)
     if error_type:
-        app_logger.error(f"Error type: {error_type}")
+        app_logger.error("Error type: %s", error_type)
     if stack_trace:
-        app_logger.error(f"Stack trace: {stack_trace}")
\ No newline at end of file
+        app_logger.error("Stack trace: %s", stack_trace)
\ No newline at end of file